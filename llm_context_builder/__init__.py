@@ -0,0 +1 @@
+# llm_context_builder/__init__.py
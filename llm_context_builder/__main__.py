@@ -1,14 +1,19 @@
-# llm_context_builder/main.py
+# llm_context_builder/__main__.py
 
+import logging
 import sys
-import os
-
 
 from PySide6.QtWidgets import QApplication
-# Changed from relative to absolute package import
+
 from llm_context_builder.main_window import MainWindow
 
-if __name__ == "__main__":
+
+def main():
+    # Root-logger configuration happens here, not in library modules, so
+    # embedders of file_processor keep control of their own logging.
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
     app = QApplication(sys.argv)
 
     # Optional: Set application details for QSettings
@@ -18,4 +23,8 @@ if __name__ == "__main__":
     window = MainWindow()
     window.show()
 
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
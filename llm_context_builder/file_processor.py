@@ -0,0 +1,266 @@
+# llm_context_builder/file_processor.py
+
+import io
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+
+# Logging configuration belongs to the application entry point
+# (__main__.main); a library module only names its logger.
+logger = logging.getLogger(__name__)
+
+# --- Configuration for ignored items ---
+# Common directories/files to ignore by default (can be customized)
+DEFAULT_IGNORE_PATTERNS = {
+    ".git", "__pycache__", ".vscode", ".idea", "node_modules", "venv",
+    ".DS_Store", "*.pyc", "*.log", "*.tmp", "*.swp"
+}
+# Common binary file extensions to skip reading content
+BINARY_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.tif', '.tiff',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.tar', '.gz', '.rar', '.7z',
+    '.exe', '.dll', '.so', '.dylib', '.app',
+    '.o', '.a', '.lib',
+    '.mp3', '.wav', '.ogg', '.mp4', '.avi', '.mov', '.wmv',
+    '.db', '.sqlite', '.sqlite3'
+})
+
+def is_likely_binary(filepath, _bin=BINARY_EXTENSIONS):
+    """Check if a file is likely binary based on its extension."""
+    # rfind + slice instead of os.path.splitext: same answer for the lookup,
+    # no tuple allocation. The default arg pins the frozenset in locals so
+    # the hot path skips the module-globals lookup.
+    i = filepath.rfind('.')
+    return i != -1 and filepath[i:].lower() in _bin
+
+def compile_ignore_patterns(ignore_patterns):
+    """
+    Split raw ignore patterns into (exact_names, suffixes) for O(1) matching.
+
+    Exact names go into a frozenset; "*.ext" wildcards become a tuple of
+    ".ext" suffixes that str.endswith can test natively in one C call.
+    """
+    exact_names = frozenset(p for p in ignore_patterns if not p.startswith("*."))
+    suffixes = tuple(p[1:] for p in ignore_patterns if p.startswith("*."))
+    # New patterns invalidate previously cached decisions
+    _should_ignore_cached.cache_clear()
+    return exact_names, suffixes
+
+
+@lru_cache(maxsize=8192)
+def _should_ignore_cached(name, exact_names, suffixes):
+    return name in exact_names or name.endswith(suffixes)
+
+
+def should_ignore(name, exact_names, suffixes):
+    """Check if a file/directory name matches the compiled ignore patterns.
+
+    Decisions are memoized per name: a handful of basenames (__pycache__,
+    .DS_Store, node_modules, ...) recur in every directory of a tree walk,
+    so the cache hit rate approaches 100% after the first few directories.
+    """
+    return _should_ignore_cached(name, exact_names, suffixes)
+
+
+# Buffer sizes for file I/O. The defaults (8 KiB) cause one write() syscall
+# per separator/file chunk; larger buffers coalesce them into ~1 syscall/MiB.
+READ_BUFFER_SIZE = 1 << 18   # 256 KiB per input file
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB for the output file
+
+# Separator pieces, pre-encoded. Both sides of the copy run in binary mode
+# so file bytes pass straight through without a utf-8 decode/encode cycle;
+# only these small framing strings and the relative paths get encoded.
+SEP_PREFIX = b"\n--- File: "
+SEP_SUFFIX = b" ---\n\n"
+SEP_BINARY_SUFFIX = b" (Binary file, content skipped) ---\n"
+
+
+def _read_one(file_path):
+    """Read a single file's raw bytes. Returns (path, content, error).
+
+    No existence pre-check: open() either succeeds or raises, which is one
+    syscall instead of stat+open and avoids the TOCTOU race. The exception
+    is returned so the caller can tell a vanished file from a read failure.
+    """
+    try:
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as infile:
+            return file_path, infile.read(), None
+    except Exception as e:
+        return file_path, None, e
+
+
+def generate_context_file(selected_files, output_path, project_root, max_workers=None,
+                          return_content=True, progress_callback=None):
+    """
+    Reads content from selected files and writes it to the output file.
+
+    File contents are read concurrently in a thread pool (the GIL is released
+    during blocking I/O, so this overlaps per-file latency) and written
+    serially in sorted order so the output stays deterministic. Only a small
+    window of reads is in flight at a time, so contents stream through
+    rather than accumulating in memory.
+
+    Args:
+        selected_files (list): A list of absolute paths to the files to include.
+        output_path (str): The absolute path for the output text file.
+        project_root (str): The absolute path of the project root directory.
+        max_workers (int, optional): Thread count for concurrent reads.
+            Defaults to min(32, cpu_count * 4) — tuned for I/O wait, not CPU.
+        return_content (bool): If False, skip building the concatenated
+            in-memory copy of the output and return None for the content.
+            The copy is the only thing that grows with context size — with
+            it skipped, peak memory is just the bounded read window.
+        progress_callback (callable, optional): Called as
+            progress_callback(done, total, relative_path) as each file's
+            read is consumed, in output order, from the calling thread.
+
+    Returns:
+        tuple: (success (bool), message/content (str))
+               If success is True, message is ((content or None), user message).
+               If success is False, message is an error description.
+    """
+    # BytesIO keeps a single growing buffer instead of a list of per-chunk
+    # strings plus a final join copy — roughly halves peak memory.
+    content_buf = io.BytesIO() if return_content else None
+    file_count = 0
+    errors = []
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    # Ensure output directory exists; exist_ok collapses the old
+    # exists()+makedirs pair into one race-free call.
+    output_dir = os.path.dirname(output_path)
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError as e:
+        error_msg = f"Error creating output directory {output_dir}: {e}"
+        logger.error(error_msg)
+        return False, error_msg
+
+    try:
+        # A duplicated selection would collide in the path-keyed read window
+        # below (its future is popped on first use); dict.fromkeys dedupes
+        # while keeping order.
+        selected_files = list(dict.fromkeys(selected_files))
+
+        # Compute each relative path exactly once, sorted for consistent
+        # order. Files under project_root (the overwhelming case) take a
+        # prefix-slice fast path instead of os.path.relpath's full
+        # abspath/split/join machinery.
+        root_prefix = project_root.rstrip(os.sep) + os.sep
+        prefix_len = len(root_prefix)
+        sorted_relative = sorted(
+            ((p[prefix_len:] if p.startswith(root_prefix)
+              else os.path.relpath(p, project_root), p)
+             for p in selected_files),
+            key=itemgetter(0))
+
+        # Classify files up front so only likely-text files hit the pool
+        read_targets = [p for _, p in sorted_relative if not is_likely_binary(p)]
+        total_reads = len(read_targets)
+        reads_done = 0
+
+        # Reads are submitted in output order and consumed in that same
+        # order, with at most a small window in flight. Out-of-order
+        # completions just sit in their futures until due, so the write loop
+        # below stays serial and deterministic while peak memory is bounded
+        # by the window — not by the whole context, which matters for the
+        # multi-GB case.
+        executor = None
+        in_flight = {}
+        if read_targets:
+            workers = min(max_workers, total_reads)
+            executor = ThreadPoolExecutor(max_workers=workers)
+            read_window = workers * 2
+            target_iter = iter(read_targets)
+
+            def _top_up():
+                while len(in_flight) < read_window:
+                    try:
+                        p = next(target_iter)
+                    except StopIteration:
+                        return
+                    in_flight[p] = executor.submit(_read_one, p)
+
+            _top_up()
+
+        try:
+            with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as outfile:
+                # Tell the kernel this is a one-pass sequential write (bigger
+                # readahead for anything re-reading it). Not available everywhere.
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(outfile.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                for relative_path, file_path in sorted_relative:
+                    # Per-file records are DEBUG: at the default INFO level
+                    # the lazy %s formatting means these lines cost one level
+                    # check each, nothing more.
+                    logger.debug("Processing: %s", relative_path)
+                    rel_bytes = relative_path.encode('utf-8', 'replace')
+
+                    if is_likely_binary(file_path):
+                        # Binary files never hit the pool
+                        logger.debug("Skipping likely binary file: %s", relative_path)
+                        # Optionally add a note about the binary file instead of skipping silently
+                        chunks = [SEP_PREFIX + rel_bytes + SEP_BINARY_SUFFIX]
+                    else:
+                        _, content, error = in_flight.pop(file_path).result()
+                        _top_up() # Backfill the slot this read just freed
+                        reads_done += 1
+                        if progress_callback is not None:
+                            progress_callback(reads_done, total_reads, relative_path)
+                        if isinstance(error, FileNotFoundError):
+                            logger.warning("Skipping non-existent file: %s", relative_path)
+                            errors.append(f"Skipped non-existent file: {relative_path}")
+                            continue
+
+                        chunks = [SEP_PREFIX + rel_bytes + SEP_SUFFIX]
+                        if error is None:
+                            chunks.append(content)
+                            chunks.append(b"\n") # Add newline after content
+                            file_count += 1
+                        else:
+                            error_msg = f"Error reading {relative_path}: {error}"
+                            logger.error(error_msg)
+                            errors.append(error_msg)
+                            chunks.append(f"*** Error reading file: {error} ***\n".encode('utf-8', 'replace'))
+
+                    # One writelines call per file; the buffered layer flushes
+                    # the pieces together instead of one syscall per write().
+                    outfile.writelines(chunks)
+                    if content_buf is not None:
+                        content_buf.writelines(chunks)
+
+                # We never re-read the generated file; drop its pages from the
+                # page cache so a multi-GB context doesn't evict other data.
+                if hasattr(os, "posix_fadvise"):
+                    outfile.flush()
+                    os.posix_fadvise(outfile.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            if executor is not None:
+                # Normal completion has drained every future; on error this
+                # drops whatever the window still holds.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        # Callers (clipboard, preview) want text, so decode the single buffer
+        # once at the end — only paid when return_content is requested.
+        final_content = (content_buf.getvalue().decode('utf-8', errors='ignore')
+                         if content_buf is not None else None)
+        success_msg = f"Successfully generated context file at:\n{output_path}\n\nProcessed {file_count} text files."
+        if errors:
+            success_msg += "\n\nEncountered some issues:\n- " + "\n- ".join(errors)
+        logger.info("Finished generating %s. Processed %d files.", output_path, file_count)
+        return True, (final_content, success_msg) # Return content and user message
+
+    except IOError as e:
+        error_msg = f"Error writing to output file {output_path}: {e}"
+        logger.error(error_msg)
+        return False, error_msg
+    except Exception as e:
+        error_msg = f"An unexpected error occurred during generation: {e}"
+        logger.exception(error_msg) # Log full traceback
+        return False, error_msg
\ No newline at end of file
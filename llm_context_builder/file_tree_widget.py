@@ -0,0 +1,658 @@
+# llm_context_builder/file_tree_widget.py
+
+import os
+import sys # Import sys for path manipulation
+import queue
+import threading
+from collections import deque
+from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QApplication
+from PySide6.QtCore import Qt, Slot, Signal
+from PySide6.QtGui import QIcon, QColor # Added QColor for error text
+
+from llm_context_builder.file_processor import (DEFAULT_IGNORE_PATTERNS,
+                                                compile_ignore_patterns,
+                                                should_ignore)
+
+# --- Background scan tuning ---
+SCAN_WORKERS = 4
+# Directories with this many subdirectories or fewer are scanned inline by
+# the worker that found them; re-queueing tiny subtrees costs more in thread
+# handoff than the scan itself.
+PARALLEL_SCAN_THRESHOLD = 4
+
+# --- Helper Function to get resource path ---
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller """
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        # If not running as a bundled app, use the directory of this script file
+        base_path = os.path.dirname(os.path.abspath(__file__)) # Use directory of file_tree_widget.py
+    return os.path.join(base_path, relative_path)
+
+# --- Define Icon Paths Using resource_path ---
+ICON_FOLDER_PATH = resource_path("icons/folder.png")
+ICON_FILE_PATH = resource_path("icons/file.png")
+
+
+class _FileItem(QTreeWidgetItem):
+    """
+    Tree item that carries its path and type as plain Python attributes.
+
+    Reading an attribute is a dict lookup; the setData/data(UserRole)
+    alternative crosses the Python/C++ boundary and wraps/unwraps a QVariant
+    on every access, which adds up during check-state cascades.
+    """
+    __slots__ = ("path", "is_dir")
+
+
+class _PlaceholderItem(QTreeWidgetItem):
+    """Stand-in child under a directory whose contents are not scanned yet."""
+    pass
+
+
+class FileTreeWidget(QTreeWidget):
+    """
+    A QTreeWidget subclass to display a directory structure with checkboxes
+    and handle hierarchical selection.
+
+    Directory scanning runs on a small pool of background threads; results
+    are posted back to the GUI thread in batches via queued signals, because
+    QTreeWidgetItems may only be created/modified on the main thread.
+    """
+
+    # Emitted on the GUI thread once a background population has fully
+    # drained and initial check states are applied.
+    population_finished = Signal()
+
+    # Internal cross-thread plumbing: (scan generation, parent path, children)
+    _scan_batch_ready = Signal(int, str, list)
+    _scan_finished = Signal(int)
+
+    # Shared icons, loaded once per process. Every item references the same
+    # QIcon instance, so Qt's pixmap cache holds one entry per icon instead
+    # of one per widget.
+    _icon_folder = None
+    _icon_file = None
+
+    @classmethod
+    def _ensure_icons_loaded(cls):
+        """Load the folder/file icons once, on first widget construction."""
+        if cls._icon_folder is not None:
+            return
+
+        # --- Load Icons using absolute paths ---
+        try:
+            # Try loading from theme first
+            icon_folder = QIcon.fromTheme("folder")
+            icon_file = QIcon.fromTheme("text-x-generic")
+
+            # If theme icons are null (not found), try loading from files
+            if icon_folder.isNull():
+                print(f"Theme icon 'folder' not found, trying file: {ICON_FOLDER_PATH}")
+                icon_folder = QIcon(ICON_FOLDER_PATH)
+
+            if icon_file.isNull():
+                print(f"Theme icon 'text-x-generic' not found, trying file: {ICON_FILE_PATH}")
+                icon_file = QIcon(ICON_FILE_PATH)
+
+            # Final check: If still null after trying files, raise error to fallback
+            if icon_folder.isNull() or icon_file.isNull():
+                 # Check if the files actually exist for better debugging
+                 folder_exists = os.path.exists(ICON_FOLDER_PATH)
+                 file_exists = os.path.exists(ICON_FILE_PATH)
+                 raise RuntimeError(f"Failed to load icons. Exists? Folder: {folder_exists}, File: {file_exists}")
+
+        except Exception as e:
+            print(f"Warning: Could not load custom/file icons ({e}). Falling back to system style.")
+            style = QApplication.style()
+            icon_folder = style.standardIcon(style.StandardPixmap.SP_DirIcon)
+            icon_file = style.standardIcon(style.StandardPixmap.SP_FileIcon)
+        # --- End Icon Loading ---
+
+        cls._icon_folder = icon_folder
+        cls._icon_file = icon_file
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._ensure_icons_loaded()
+
+        self.setHeaderLabel("Project Files")
+        self.setColumnCount(1)
+        # All rows are one line high; lets Qt skip per-item size hints
+        self.setUniformRowHeights(True)
+        self.project_root = None
+        self._ignore_patterns = DEFAULT_IGNORE_PATTERNS.copy() # Use a copy
+        self._compile_ignore()
+
+        self.itemChanged.connect(self._handle_item_changed)
+        self._is_changing_programmatically = False
+
+        # --- Background scan state ---
+        # Bumping the generation abandons any in-flight scan: stale batches
+        # are dropped in the GUI slots and stale workers exit on their own.
+        self._scan_generation = 0
+        self._scan_lock = threading.Lock()
+        self._item_for_path = {}
+        self._scan_placeholder = None
+        # Checked file paths, maintained incrementally as states flip, so
+        # get_selected_files never has to scan the tree at all
+        self._checked_files = set()
+        self._scan_batch_ready.connect(self._append_children)
+        self._scan_finished.connect(self._on_scan_finished)
+
+        # --- Lazy population state (populate_tree_lazy) ---
+        # In lazy mode directories carry a placeholder child and are only
+        # scanned when first expanded; _lazy_pending guards against kicking
+        # off the same scan twice while a batch is in flight.
+        self._lazy_mode = False
+        self._lazy_pending = set()
+        self.itemExpanded.connect(self._on_item_expanded)
+
+        # Optional monospace font:
+        # self.setFont(QFont("monospace")) # (QFont from PySide6.QtGui)
+
+
+    def set_ignore_patterns(self, patterns):
+        """Set the patterns to ignore when populating the tree."""
+        self._ignore_patterns = set(patterns)
+        self._compile_ignore()
+        if self.project_root:
+            self.populate_tree(self.project_root) # Repopulate if needed
+
+    def get_ignore_patterns(self):
+        """Get the current set of ignore patterns."""
+        return self._ignore_patterns
+
+    def _compile_ignore(self):
+        """Precompile the ignore patterns into O(1)-matchable structures."""
+        self._ignore_exact, self._ignore_suffixes = \
+            compile_ignore_patterns(self._ignore_patterns)
+
+    # --- THIS METHOD WAS LIKELY MISSING OR MISPLACED ---
+    @Slot(str)
+    def populate_tree(self, directory_path):
+        """
+        Populates the tree widget with the contents of the given directory.
+
+        Only the root item is created synchronously; the directory walk runs
+        on background threads and children are appended incrementally as
+        batches arrive, so the GUI never blocks on filesystem latency.
+        """
+        self.clear() # Clear existing items
+        self._item_for_path = {}
+        self._checked_files.clear()
+        self._scan_placeholder = None
+        self._lazy_mode = False
+        self._lazy_pending.clear()
+        self._scan_generation += 1 # Abandon any scan still in flight
+        # Sorting during insertion would re-sort on every batch; workers
+        # already deliver entries in sorted order, so suspend it until done
+        self._restore_sorting = self.isSortingEnabled()
+        if self._restore_sorting:
+            self.setSortingEnabled(False)
+        self.project_root = os.path.abspath(directory_path)
+        if not os.path.isdir(self.project_root):
+            print(f"Error: Path is not a valid directory: {self.project_root}")
+            # Optionally display an error item in the tree
+            error_item = QTreeWidgetItem(self, ["Error: Not a valid directory"])
+            error_item.setForeground(0, QColor("red"))
+            self.project_root = None
+            return
+
+        self._is_changing_programmatically = True
+        try:
+            # Add root item representing the selected directory itself
+            root_display_name = os.path.basename(self.project_root) # Show only folder name
+            root_item = self._add_item(None, self.project_root, is_dir=True, display_name=root_display_name)
+            root_item.setExpanded(True) # Expand the root node by default
+            self._item_for_path[self.project_root] = root_item
+
+            # Placeholder shown until the background scan drains
+            self._scan_placeholder = QTreeWidgetItem(root_item, ["Scanning..."])
+            self._scan_placeholder.setForeground(0, QColor("grey"))
+            self._scan_placeholder.setFlags(
+                self._scan_placeholder.flags() & ~Qt.ItemFlag.ItemIsUserCheckable)
+        finally:
+            self._is_changing_programmatically = False
+
+        self._start_scan(self.project_root)
+
+
+    @Slot(str)
+    def populate_tree_lazy(self, directory_path):
+        """
+        Populates only the first level of the given directory; each
+        subdirectory gets a placeholder child and is scanned on first expand.
+
+        Avoids walking the whole tree up front on huge or slow filesystems.
+        The trade-off is that get_selected_files only sees files that have
+        actually been scanned, so directories never expanded contribute
+        nothing to the selection.
+        """
+        self.clear()
+        self._item_for_path = {}
+        self._checked_files.clear()
+        self._scan_placeholder = None
+        self._lazy_mode = True
+        self._lazy_pending.clear()
+        self._scan_generation += 1 # Abandon any scan still in flight
+        self._restore_sorting = False
+        self.project_root = os.path.abspath(directory_path)
+        if not os.path.isdir(self.project_root):
+            print(f"Error: Path is not a valid directory: {self.project_root}")
+            error_item = QTreeWidgetItem(self, ["Error: Not a valid directory"])
+            error_item.setForeground(0, QColor("red"))
+            self.project_root = None
+            return
+
+        self._is_changing_programmatically = True
+        try:
+            root_display_name = os.path.basename(self.project_root)
+            root_item = self._add_item(None, self.project_root, is_dir=True,
+                                       display_name=root_display_name)
+            root_item.setCheckState(0, Qt.CheckState.Checked)
+            root_item.setExpanded(True)
+            self._item_for_path[self.project_root] = root_item
+        finally:
+            self._is_changing_programmatically = False
+
+        self._lazy_pending.add(self.project_root)
+        patterns = (self._ignore_exact, self._ignore_suffixes)
+        threading.Thread(
+            target=self._scan_one_level,
+            args=(self._scan_generation, patterns, self.project_root),
+            daemon=True,
+        ).start()
+
+    @Slot(QTreeWidgetItem)
+    def _on_item_expanded(self, item):
+        """In lazy mode, scan a directory the first time it is expanded."""
+        if not self._lazy_mode:
+            return
+        path = getattr(item, "path", None)
+        if path is None or path in self._lazy_pending:
+            return
+        # Only directories still holding their placeholder need a scan
+        if not (item.childCount() == 1
+                and isinstance(item.child(0), _PlaceholderItem)):
+            return
+        self._lazy_pending.add(path)
+        patterns = (self._ignore_exact, self._ignore_suffixes)
+        threading.Thread(
+            target=self._scan_one_level,
+            args=(self._scan_generation, patterns, path),
+            daemon=True,
+        ).start()
+
+    def _scan_one_level(self, generation, patterns, directory_path):
+        """Scan a single directory level and emit its children (no descent)."""
+        try:
+            with os.scandir(directory_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            print(f"Warning: Could not access {directory_path}: {e}")
+            self._scan_batch_ready.emit(generation, directory_path,
+                                        [(None, None, "error")])
+            return
+
+        children = []
+        exact_names, suffixes = patterns
+        for entry in entries:
+            if should_ignore(entry.name, exact_names, suffixes):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                children.append((entry.name, entry.path, "dir"))
+            elif entry.is_file(follow_symlinks=False):
+                children.append((entry.name, entry.path, "file"))
+
+        self._scan_batch_ready.emit(generation, directory_path, children)
+
+
+    def _start_scan(self, root_path):
+        """Kick off the background worker pool for a fresh scan."""
+        generation = self._scan_generation
+        work_queue = queue.Queue()
+        # The pending counter is owned by this scan (a one-element list the
+        # workers share), not by the widget: workers from an abandoned scan
+        # may keep decrementing theirs after a new scan starts, and a shared
+        # instance counter would corrupt the new scan's drain detection.
+        pending = [1]
+        work_queue.put(root_path)
+        # Compiled patterns are immutable, so the snapshot is just the pair
+        patterns = (self._ignore_exact, self._ignore_suffixes)
+        for _ in range(SCAN_WORKERS):
+            threading.Thread(
+                target=self._scan_worker,
+                args=(generation, work_queue, pending, patterns),
+                daemon=True,
+            ).start()
+
+    def _scan_worker(self, generation, work_queue, pending, patterns):
+        """Worker loop: pull directories off the queue and scan them."""
+        while True:
+            try:
+                path = work_queue.get(timeout=0.1)
+            except queue.Empty:
+                if generation != self._scan_generation:
+                    return # Scan was abandoned; let the thread die
+                continue
+            if path is None: # Sentinel: scan complete
+                return
+            self._scan_dir(generation, work_queue, pending, patterns, path)
+            with self._scan_lock:
+                pending[0] -= 1
+                drained = pending[0] == 0
+            if drained:
+                for _ in range(SCAN_WORKERS):
+                    work_queue.put(None)
+                self._scan_finished.emit(generation)
+
+    def _scan_dir(self, generation, work_queue, pending, patterns, directory_path):
+        """Scan one directory and emit its children to the GUI thread."""
+        try:
+            # scandir exposes each entry's type from the directory listing
+            # itself (d_type), avoiding the two extra stat() calls per child
+            # that os.path.isdir/isfile would cost.
+            with os.scandir(directory_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            print(f"Warning: Could not access {directory_path}: {e}")
+            self._scan_batch_ready.emit(generation, directory_path,
+                                        [(None, None, "error")])
+            return
+
+        children = []
+        subdirs = []
+        exact_names, suffixes = patterns
+        for entry in entries:
+            if should_ignore(entry.name, exact_names, suffixes):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                children.append((entry.name, entry.path, "dir"))
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                children.append((entry.name, entry.path, "file"))
+            # Silently ignore other types (symlinks, etc.) for now
+
+        # Parent batch is emitted before any subdirectory work is queued, so
+        # queued-signal ordering guarantees the parent item exists when a
+        # child batch reaches the GUI thread.
+        self._scan_batch_ready.emit(generation, directory_path, children)
+
+        if len(subdirs) <= PARALLEL_SCAN_THRESHOLD:
+            # Small fan-out: recursing inline is cheaper than a queue handoff
+            for sub in subdirs:
+                self._scan_dir(generation, work_queue, pending, patterns, sub)
+        else:
+            with self._scan_lock:
+                pending[0] += len(subdirs)
+            for sub in subdirs:
+                work_queue.put(sub)
+
+    @Slot(int, str, list)
+    def _append_children(self, generation, parent_path, children):
+        """GUI-thread slot: create tree items for one scanned directory."""
+        if generation != self._scan_generation:
+            return # Batch from an abandoned scan
+        parent_item = self._item_for_path.get(parent_path)
+        if parent_item is None:
+            return
+
+        # Build the whole batch parentless, then attach with one addChildren
+        # call — one C++ model notification per directory instead of one per
+        # item, with repaints and signals suppressed while we mutate.
+        self._is_changing_programmatically = True
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            batch = []
+            for name, path, kind in children:
+                if kind == "error":
+                    error_item = QTreeWidgetItem(None, [f"Error accessing folder content"])
+                    error_item.setForeground(0, QColor("red")) # Use QColor
+                    error_item.setFlags(error_item.flags() & ~Qt.ItemFlag.ItemIsUserCheckable)
+                    batch.append(error_item)
+                    continue
+                is_dir = kind == "dir"
+                item = self._new_item(path, is_dir=is_dir)
+                batch.append(item)
+                if is_dir:
+                    self._item_for_path[path] = item
+                    if self._lazy_mode:
+                        # Placeholder keeps the expand arrow visible and
+                        # marks the directory as not-yet-scanned
+                        placeholder = _PlaceholderItem(None, ["Loading..."])
+                        placeholder.setForeground(0, QColor("grey"))
+                        placeholder.setFlags(
+                            placeholder.flags() & ~Qt.ItemFlag.ItemIsUserCheckable)
+                        item.addChild(placeholder)
+            if self._lazy_mode:
+                # This batch replaces the parent's own placeholder, if any
+                if (parent_item.childCount() == 1
+                        and isinstance(parent_item.child(0), _PlaceholderItem)):
+                    parent_item.removeChild(parent_item.child(0))
+                self._lazy_pending.discard(parent_path)
+            parent_item.addChildren(batch)
+            if self._lazy_mode:
+                # No final scan pass will run in lazy mode, so late-arriving
+                # children inherit the parent's state here
+                state = parent_item.checkState(0)
+                if state != Qt.CheckState.PartiallyChecked:
+                    for child in batch:
+                        if not (child.flags() & Qt.ItemFlag.ItemIsUserCheckable):
+                            continue
+                        child.setCheckState(0, state)
+                        if (isinstance(child, _FileItem) and not child.is_dir
+                                and state == Qt.CheckState.Checked):
+                            self._checked_files.add(child.path)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self._is_changing_programmatically = False
+
+        # Lazy mode has no drain event; the root's own batch is the moment
+        # the (visible) population is done
+        if self._lazy_mode and parent_path == self.project_root:
+            self.population_finished.emit()
+
+    @Slot(int)
+    def _on_scan_finished(self, generation):
+        """GUI-thread slot: finalize the tree once the scan queue drains."""
+        if generation != self._scan_generation:
+            return
+        if self._scan_placeholder is not None:
+            parent = self._scan_placeholder.parent()
+            if parent is not None:
+                parent.removeChild(self._scan_placeholder)
+            self._scan_placeholder = None
+
+        # Set initial state after population and signal enabling
+        # Use invisibleRootItem() to affect the top-level items added
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_check_state_recursive(self.invisibleRootItem(), Qt.CheckState.Checked)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
+        if getattr(self, "_restore_sorting", False):
+            self.setSortingEnabled(True)
+
+        self.population_finished.emit()
+
+
+    # Added display_name parameter for flexibility (e.g., for root item)
+    def _new_item(self, path, is_dir, display_name=None):
+        """Constructs a configured, parentless item; caller attaches it."""
+        if display_name is None:
+            display_name = os.path.basename(path)
+
+        item = _FileItem(None)
+        item.path = path # Store full path
+        item.is_dir = is_dir # Store type
+        item.setText(0, display_name)
+
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsAutoTristate)
+        # Don't set check state here - let the final step in populate_tree handle it
+
+        item.setIcon(0, FileTreeWidget._icon_folder if is_dir else FileTreeWidget._icon_file)
+
+        # Tooltip shows the full path
+        item.setToolTip(0, path)
+
+        return item
+
+    def _add_item(self, parent, path, is_dir, display_name=None):
+        """Adds an item to the tree, setting flags and data."""
+        item = self._new_item(path, is_dir, display_name)
+        if parent:
+            parent.addChild(item)
+        else:
+            self.addTopLevelItem(item) # Add to tree root if parent is None
+        return item
+
+
+    @Slot(QTreeWidgetItem, int)
+    def _handle_item_changed(self, item, column):
+        """Handles changes to item check states, implementing hierarchy."""
+        # Check if the change is relevant (column 0) and not programmatically triggered within this handler
+        if column == 0 and not self._is_changing_programmatically:
+            self._is_changing_programmatically = True  # Prevent infinite recursion
+            try:
+                current_check_state = item.checkState(0) # Get the state *after* the change
+                is_dir = getattr(item, "is_dir", False) # Plain items (error rows) are never dirs
+
+                # Keep the checked-file set in sync with user toggles
+                if not is_dir and isinstance(item, _FileItem):
+                    if current_check_state == Qt.CheckState.Checked:
+                        self._checked_files.add(item.path)
+                    else:
+                        self._checked_files.discard(item.path)
+
+                # --- Propagate check state downwards ONLY if it's a directory
+                # --- AND the state change was to fully Checked or Unchecked.
+                # --- Do NOT propagate if the state became PartiallyChecked, as this
+                # --- usually happens because a child changed, not a direct user click
+                # --- on the directory checkbox with the intent to check/uncheck all.
+                if is_dir and current_check_state != Qt.CheckState.PartiallyChecked:
+                    # User explicitly checked or unchecked the directory item itself.
+                    # Apply this state to all checkable children recursively.
+                    self._set_check_state_recursive_children_only(item, current_check_state)
+
+                # --- Always update the parent's state based on children states ---
+                # This needs to happen regardless of whether the current item is a file or directory,
+                # or whether downward propagation occurred.
+                self._update_parent_state(item.parent())
+
+            finally:
+                self._is_changing_programmatically = False # Release the lock
+
+    # ... (rest of the class, including _set_check_state_recursive_children_only and _update_parent_state) ...
+
+
+
+    def _set_check_state_recursive(self, parent_item, state):
+        """Recursively set the check state, starting from parent_item (can be root)."""
+        # Handle the invisible root item passed from populate_tree
+        if parent_item == self.invisibleRootItem():
+            for i in range(self.topLevelItemCount()):
+                child = self.topLevelItem(i)
+                if child.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+                     if child.checkState(0) != state:
+                         child.setCheckState(0, state)
+                     # Recurse only if it's a directory
+                     if getattr(child, "is_dir", False):
+                         self._set_check_state_recursive_children_only(child, state)
+        elif parent_item: # Handle regular items passed from _handle_item_changed
+             if parent_item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+                  if parent_item.checkState(0) != state:
+                       parent_item.setCheckState(0, state)
+                  # Apply to children only if it's a directory
+                  if getattr(parent_item, "is_dir", False):
+                      self._set_check_state_recursive_children_only(parent_item, state)
+
+
+    def _set_check_state_recursive_children_only(self, parent_item, state):
+        """Helper to apply state only to children, avoids re-applying to parent"""
+        if not parent_item: return # Safety check
+
+        # Explicit stack instead of recursion: no Python frame creation per
+        # tree level, and already-correct leaves are skipped without a call.
+        stack = deque([parent_item])
+        while stack:
+            item = stack.pop()
+            for i in range(item.childCount()):
+                child = item.child(i)
+                if child.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+                    is_dir = getattr(child, "is_dir", False)
+                    # Only set state if it's different, prevents unnecessary signals
+                    if child.checkState(0) != state:
+                        child.setCheckState(0, state) # This might trigger _handle_item_changed if user interacts
+                        # Programmatic flips bypass _handle_item_changed, so
+                        # track checked files inline
+                        if not is_dir and isinstance(child, _FileItem):
+                            if state == Qt.CheckState.Checked:
+                                self._checked_files.add(child.path)
+                            else:
+                                self._checked_files.discard(child.path)
+
+                    # Still need to visit grandchildren if the child is a directory,
+                    # even if the child's state didn't change itself.
+                    if is_dir:
+                        stack.append(child)
+
+
+    def _update_parent_state(self, parent_item):
+        """Updates the parent's check state based on its children."""
+        if not parent_item or parent_item == self.invisibleRootItem():
+            return # Stop at the root or if no parent
+
+        checked_count = 0
+        unchecked_count = 0
+        partially_checked_count = 0
+        total_checkable_children = 0
+
+        for i in range(parent_item.childCount()):
+            child = parent_item.child(i)
+            if child.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+                total_checkable_children += 1
+                state = child.checkState(0)
+                if state == Qt.CheckState.Checked:
+                    checked_count += 1
+                elif state == Qt.CheckState.Unchecked:
+                    unchecked_count += 1
+                else: # PartiallyChecked
+                    partially_checked_count += 1
+
+        new_state = Qt.CheckState.PartiallyChecked # Default
+        if total_checkable_children == 0:
+             # No checkable children, maybe keep parent state? Or default to checked?
+             # Let's default to Checked as it's the initial state.
+             new_state = Qt.CheckState.Checked
+        elif partially_checked_count > 0:
+            new_state = Qt.CheckState.PartiallyChecked
+        elif checked_count == total_checkable_children:
+            new_state = Qt.CheckState.Checked
+        elif unchecked_count == total_checkable_children:
+            new_state = Qt.CheckState.Unchecked
+        # Else, it remains PartiallyChecked (mix of checked/unchecked)
+
+        if parent_item.checkState(0) != new_state:
+             parent_item.setCheckState(0, new_state)
+             # No need for explicit recursion up, signal/slot handles parent update
+
+
+    def get_selected_files(self):
+        """
+        Returns a sorted list of absolute paths for all *checked* files.
+
+        Reads the incrementally-maintained set instead of walking the tree,
+        so no item is visited at all.
+        """
+        # Only include files that are explicitly checked; the set is kept
+        # current by the check-state handlers, so this is O(K log K) in the
+        # number of checked files rather than O(N) in tree size
+        return sorted(self._checked_files)
\ No newline at end of file
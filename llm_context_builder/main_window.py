@@ -0,0 +1,513 @@
+# llm_context_builder/main_window.py
+
+import os
+import time
+import functools
+from PySide6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QLabel, QFileDialog, QMessageBox, QCheckBox, QLineEdit,
+    QStatusBar, QProgressBar
+)
+from PySide6.QtGui import QIcon, QDesktopServices
+from PySide6.QtCore import Qt, Slot, Signal, QObject, QThread, QSettings, QTimer, QUrl
+
+# Changed from relative to absolute package imports
+from llm_context_builder.file_tree_widget import FileTreeWidget
+
+
+# --- Application Settings ---
+ORG_NAME = "MyCompany" # Or your name/handle
+APP_NAME = "LLMContextBuilder"
+SETTINGS_OUTPUT_PATH = "lastOutputPath"
+SETTINGS_COPY_CLIPBOARD = "copyToClipboard"
+
+
+@functools.lru_cache(maxsize=32)
+def _icon(name):
+    """Theme icon lookup, cached: XDG theme walks and SVG parsing can cost
+    tens of ms each on a cold cache, and buttons often share icons."""
+    return QIcon.fromTheme(name)
+
+
+class GenerateWorker(QObject):
+    """
+    Runs generate_context_file on a background thread.
+
+    The GUI thread constructs the worker, moves it to a QThread and connects
+    the signals below; the window stays responsive while files are read and
+    the output is written.
+    """
+    progress = Signal(int, int, str)  # files done, files total, current path
+    finished = Signal(bool, object)   # success, (None, user message) or error string
+    clipboard_text = Signal(str)      # generated content, for the clipboard only
+
+    def __init__(self, selected_files, output_path, project_root, return_content=False):
+        super().__init__()
+        self._selected_files = selected_files
+        self._output_path = output_path
+        self._project_root = project_root
+        self._return_content = return_content
+
+    @Slot()
+    def run(self):
+        # Give the progress bar its determinate range as soon as the worker
+        # actually starts; all further UI updates flow through signals.
+        self.progress.emit(0, len(self._selected_files), "Reading files...")
+
+        # Imported on first generation rather than at window import time;
+        # sys.modules caching makes subsequent runs free.
+        from llm_context_builder.file_processor import generate_context_file
+
+        # Content is only materialized in memory when the caller needs it
+        # (clipboard copy); otherwise everything streams straight to disk.
+        success, result = generate_context_file(
+            self._selected_files,
+            self._output_path,
+            self._project_root,
+            return_content=self._return_content,
+            # Signal emit is thread-safe; delivery to the GUI thread is queued
+            progress_callback=self.progress.emit,
+        )
+        if success:
+            content, user_message = result
+            if content is not None:
+                # Ship the text to the GUI thread on its own queued signal
+                # and drop our reference; the finished payload stays small
+                # so nothing retains the full context after the copy.
+                self.clipboard_text.emit(content)
+                del content
+            result = (None, user_message)
+        self.finished.emit(success, result)
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle(f"{APP_NAME} - Context Generator")
+        self.setGeometry(100, 100, 800, 600) # x, y, width, height
+
+        self.settings = QSettings(ORG_NAME, APP_NAME)
+        # App-singleton and environment lookups hoisted out of the handlers
+        # that use them repeatedly
+        self._clipboard = QApplication.clipboard()
+        self._home = os.path.expanduser("~")
+        self.current_project_dir = None
+        # Normalized project dir with trailing separator, cached once at
+        # selection time for the containment check in select_output_file
+        self._project_dir_norm = None
+        self.output_file_path = None
+        # Set while a generate click is waiting on the output-file dialog
+        self._generate_after_output_select = False
+        # True while a generation worker is in flight. The disabled button is
+        # UX only; a queued second click can still be delivered, so this flag
+        # is what actually prevents reentrancy.
+        self._generating = False
+        # Timestamp of the last progress repaint, for ~10 Hz throttling
+        self._status_last_ts = 0.0
+        # Suggested output filename, recomputed only when the project changes
+        self._default_output_name = "llm_context.txt"
+
+        # --- Central Widget and Layout ---
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+
+        # --- Directory Selection Area ---
+        dir_layout = QHBoxLayout()
+        self.select_dir_button = QPushButton("Select Project Directory...")
+        self.select_dir_button.setIcon(_icon("folder-open"))
+        self.dir_label = QLabel("No project directory selected.")
+        self.dir_label.setStyleSheet("font-style: italic; color: grey;")
+        dir_layout.addWidget(self.select_dir_button)
+        dir_layout.addWidget(self.dir_label, 1) # Stretch label
+        main_layout.addLayout(dir_layout)
+
+        # --- File Tree ---
+        self.file_tree = FileTreeWidget() # Use the custom widget
+        main_layout.addWidget(self.file_tree, 1) # Tree takes most space
+
+        # --- Output Configuration Area ---
+        output_layout = QHBoxLayout()
+        self.select_output_button = QPushButton("Output File...")
+        self.select_output_button.setIcon(_icon("document-save-as"))
+        self.output_path_display = QLineEdit()
+        self.output_path_display.setPlaceholderText("Select output file location...")
+        self.output_path_display.setReadOnly(True) # Prevent manual editing
+        output_layout.addWidget(self.select_output_button)
+        output_layout.addWidget(self.output_path_display, 1)
+        main_layout.addLayout(output_layout)
+
+        # --- Options and Action Area ---
+        action_layout = QHBoxLayout()
+        self.copy_clipboard_checkbox = QCheckBox("Copy content to clipboard")
+        self.generate_button = QPushButton("Generate Context File")
+        self.generate_button.setIcon(_icon("document-save"))
+        self.generate_button.setStyleSheet("font-weight: bold;")
+        action_layout.addWidget(self.copy_clipboard_checkbox)
+        action_layout.addStretch()
+        action_layout.addWidget(self.generate_button)
+        main_layout.addLayout(action_layout)
+
+        # --- Status Bar ---
+        self.statusBar = QStatusBar()
+        self.setStatusBar(self.statusBar)
+        self.statusBar.showMessage("Ready.")
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide() # Only visible while generating
+        self.statusBar.addPermanentWidget(self.progress_bar)
+
+        # --- Reusable Message Boxes ---
+        # The static QMessageBox helpers construct and destroy a full dialog
+        # (layout, icon, buttons) per call; these two are built once and just
+        # retitled per use. Up to three can appear in a single generate flow.
+        self._question_box = QMessageBox(self)
+        self._question_box.setIcon(QMessageBox.Icon.Question)
+        self._question_box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        self._question_box.setDefaultButton(QMessageBox.StandardButton.No)
+        self._notice_box = QMessageBox(self)
+        self._notice_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # --- Optional: Output Preview Area ---
+        # self.preview_area = QTextEdit()
+        # self.preview_area.setReadOnly(True)
+        # self.preview_area.setPlaceholderText("Generated content will appear here (if enabled)...")
+        # main_layout.addWidget(self.preview_area, 1) # Add preview area
+
+        # --- Settings Write Debounce ---
+        # Rapid toggles collapse into one QSettings write (registry/plist on
+        # some platforms) once the timer settles.
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(250)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        self._last_saved_path = None
+        self._last_saved_copy = None
+
+        # --- Load Settings ---
+        self._load_settings()
+
+        # --- Connect Signals ---
+        self.select_dir_button.clicked.connect(self.select_project_directory)
+        self.select_output_button.clicked.connect(self.select_output_file)
+        self.generate_button.clicked.connect(self.generate_output)
+        self.file_tree.population_finished.connect(self._on_tree_populated)
+        # Checkbox toggles are persisted via the debounced save by default,
+        # so a crash or force-kill can't lose the preference. Setting
+        # LCB_CLOSE_ONLY_SETTINGS skips the per-toggle writes and relies on
+        # the closeEvent flush alone, halving QSettings traffic per session.
+        if not os.environ.get("LCB_CLOSE_ONLY_SETTINGS"):
+            self.copy_clipboard_checkbox.stateChanged.connect(self._schedule_settings_save)
+
+
+    # --- Reusable Dialog Helpers ---
+
+    def _ask(self, title, text):
+        """Run the shared Yes/No question box; returns True on Yes."""
+        self._question_box.setWindowTitle(title)
+        self._question_box.setText(text)
+        return self._question_box.exec() == QMessageBox.StandardButton.Yes
+
+    def _notify(self, icon, title, text):
+        """Run the shared single-Ok box with the given severity icon."""
+        self._notice_box.setIcon(icon)
+        self._notice_box.setWindowTitle(title)
+        self._notice_box.setText(text)
+        self._notice_box.exec()
+
+
+    # --- Action Methods ---
+
+    @Slot()
+    def select_project_directory(self):
+        """Opens a modeless dialog to select the root project directory.
+
+        The non-static API avoids the nested event loop of the static
+        QFileDialog.get* helpers, so queued signals from background work
+        (tree scans, generation) keep being dispatched while the dialog is up.
+        """
+        dialog = QFileDialog(
+            self,
+            "Select Project Root Directory",
+            # Start from home directory or last used? For now, let's use home.
+            self._home
+        )
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_project_dir_chosen)
+        dialog.rejected.connect(
+            lambda: self.statusBar.showMessage("Directory selection cancelled.", 3000))
+        dialog.open()
+
+    @Slot(str)
+    def _on_project_dir_chosen(self, directory):
+        """Continues once the project directory dialog is accepted."""
+        if directory:
+            self.current_project_dir = os.path.abspath(directory)
+            self._project_dir_norm = \
+                os.path.normcase(os.path.normpath(self.current_project_dir)) + os.sep
+            self._default_output_name = \
+                f"{os.path.basename(self.current_project_dir)}_context.txt"
+            self.dir_label.setText(f"Project: {self.current_project_dir}")
+            self.dir_label.setStyleSheet("") # Reset style
+            self.statusBar.showMessage(f"Loading directory: {self.current_project_dir}...")
+            # The tree scans on background threads and streams entries in;
+            # _on_tree_populated fires when the scan drains.
+            self.file_tree.populate_tree(self.current_project_dir)
+            self.generate_button.setEnabled(True) # Enable generation only after dir selected
+        else:
+             self.statusBar.showMessage("Directory selection cancelled.", 3000)
+
+    @Slot()
+    def _on_tree_populated(self):
+        """Status update once the background directory scan completes."""
+        if self.current_project_dir:
+            self.statusBar.showMessage(f"Directory loaded: {self.current_project_dir}", 5000) # 5 seconds
+
+    @Slot()
+    def select_output_file(self):
+        """Opens a dialog to select the output .txt file path."""
+        # Start dialog in the directory of the last saved file, or home
+        start_dir = os.path.dirname(self.output_file_path) if self.output_file_path else self._home
+        suggested_path = os.path.join(start_dir, self._default_output_name)
+
+        dialog = QFileDialog(
+            self,
+            "Save Context File As",
+            suggested_path,
+            "Text Files (*.txt);;All Files (*)"
+        )
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_output_file_chosen)
+        dialog.rejected.connect(self._on_output_file_cancelled)
+        dialog.open()
+
+    @Slot()
+    def _on_output_file_cancelled(self):
+        """Output dialog dismissed; drop any pending generate continuation."""
+        self._generate_after_output_select = False
+        self.statusBar.showMessage("Output file selection cancelled.", 3000)
+
+    @Slot(str)
+    def _on_output_file_chosen(self, file_path):
+        """Continues once the save dialog is accepted."""
+        if file_path:
+            # Ensure it has a .txt extension if none provided; splitext
+            # avoids lowercasing a copy of the whole path
+            _, ext = os.path.splitext(file_path)
+            if ext.lower() != ".txt":
+                file_path += ".txt"
+
+            self.output_file_path = os.path.abspath(file_path)
+            self.output_path_display.setText(self.output_file_path)
+            self._schedule_settings_save() # Save the newly selected path
+
+            # --- Warning if saving inside project directory ---
+            # Compare against the cached normalized prefix (with trailing
+            # separator, so /proj never matches /project): one string
+            # comparison, no syscalls.
+            output_norm = os.path.normcase(os.path.normpath(self.output_file_path))
+            if self._project_dir_norm and output_norm.startswith(self._project_dir_norm):
+                self._notify(
+                    QMessageBox.Icon.Warning,
+                    "Output Location Warning",
+                    "Saving the output file inside the selected project directory is "
+                    "generally not recommended, as it might be included in future "
+                    "context generations.\n\nConsider saving it elsewhere."
+                )
+            self.statusBar.showMessage(f"Output file set to: {self.output_file_path}", 5000)
+
+            # Resume a generate click that was waiting on this selection
+            if self._generate_after_output_select:
+                self._generate_after_output_select = False
+                self.generate_output()
+        else:
+            self._on_output_file_cancelled()
+
+    @Slot()
+    def generate_output(self):
+        """Gathers selections, processes files, and generates the output."""
+        if self._generating:
+            return # A worker is already running; ignore duplicate clicks
+
+        if not self.current_project_dir:
+            self._notify(QMessageBox.Icon.Warning, "Error",
+                         "Please select a project directory first.")
+            return
+
+        if not self.output_file_path:
+            # If no output path specifically selected, prompt the user now.
+            # The dialog is modeless, so generation resumes from the
+            # fileSelected handler rather than blocking here.
+            self.statusBar.showMessage("Please select an output file location.", 3000)
+            self._generate_after_output_select = True
+            self.select_output_file()
+            return
+
+        selected_files = self.file_tree.get_selected_files()
+        if not selected_files:
+            self._notify(QMessageBox.Icon.Warning, "No Files Selected",
+                         "Please check the files or folders you want to include.")
+            return
+
+        # --- Overwrite Confirmation ---
+        if os.path.exists(self.output_file_path):
+            if not self._ask(
+                "Confirm Overwrite",
+                f"The output file already exists:\n{self.output_file_path}\n\nDo you want to overwrite it?"
+            ):
+                self.statusBar.showMessage("Generation cancelled by user.", 3000)
+                return
+
+        self.statusBar.showMessage("Generating context file...")
+        self._generating = True
+        self.generate_button.setEnabled(False) # Disable button during processing
+        self.progress_bar.setRange(0, 0) # Busy indicator until real progress arrives
+        self.progress_bar.show()
+
+        # --- Dispatch the Processor to a worker thread ---
+        self._gen_thread = QThread(self)
+        self._gen_worker = GenerateWorker(
+            selected_files,
+            self.output_file_path,
+            self.current_project_dir,
+            # Only pay for the in-memory copy if it's headed to the clipboard
+            return_content=self.copy_clipboard_checkbox.isChecked()
+        )
+        self._gen_worker.moveToThread(self._gen_thread)
+        self._gen_thread.started.connect(self._gen_worker.run)
+        self._gen_worker.progress.connect(self._on_generation_progress)
+        self._gen_worker.clipboard_text.connect(self._set_clipboard)
+        self._gen_worker.finished.connect(self._on_generation_finished)
+        self._gen_worker.finished.connect(self._gen_thread.quit)
+        self._gen_thread.finished.connect(self._gen_worker.deleteLater)
+        self._gen_thread.finished.connect(self._gen_thread.deleteLater)
+        self._gen_thread.start()
+
+    @Slot(int, int, str)
+    def _on_generation_progress(self, done, total, relative_path):
+        """Reflect worker progress in the status bar widgets.
+
+        Updates are coalesced to at most ~10 Hz: thousands of files would
+        otherwise mean thousands of status repaints. The final update is
+        always shown so the bar never sticks short of full.
+        """
+        now = time.monotonic()
+        if done != total and now - self._status_last_ts < 0.1:
+            return
+        self._status_last_ts = now
+        if total and self.progress_bar.maximum() != total:
+            self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.statusBar.showMessage(f"Processing: {relative_path}")
+
+    @Slot(str)
+    def _set_clipboard(self, text):
+        """GUI-thread slot: receives generated content for the clipboard."""
+        try:
+            self._clipboard.setText(text)
+            self.statusBar.showMessage("Content copied to clipboard!", 5000)
+            # Optionally add to the success message box?
+            # QMessageBox.information(self, "Success", user_message + "\n\nContent copied to clipboard.")
+        except Exception as e:
+            self._notify(QMessageBox.Icon.Warning, "Clipboard Error",
+                         f"Could not copy to clipboard: {e}")
+            self.statusBar.showMessage("File generated, but failed to copy to clipboard.", 5000)
+
+    @Slot(bool, object)
+    def _on_generation_finished(self, success, result):
+        """Handle the worker's result back on the GUI thread."""
+        self._generating = False
+        self.generate_button.setEnabled(True) # Re-enable button
+        self.progress_bar.hide()
+
+        # --- Handle Result ---
+        if success:
+            generated_content, user_message = result
+            self.statusBar.showMessage("Context file generated successfully!", 5000)
+            self._notify(QMessageBox.Icon.Information, "Success", user_message)
+
+            # --- Optional Preview ---
+            # self.preview_area.setPlainText(generated_content)
+
+            # Clipboard copy (if requested) arrives via the worker's
+            # clipboard_text signal — see _set_clipboard.
+
+            # --- Optionally Open Containing Folder ---
+            if self._ask(
+                 "Open Output Location?",
+                 "Context file generated successfully.\n\nDo you want to open the folder containing the output file?"
+             ):
+                 output_dir = os.path.dirname(self.output_file_path)
+                 try:
+                     # Use QDesktopServices for cross-platform opening
+                     QDesktopServices.openUrl(QUrl.fromLocalFile(output_dir))
+                 except Exception as e:
+                     self._notify(QMessageBox.Icon.Warning, "Error",
+                                  f"Could not open folder: {e}")
+
+
+        else:
+            error_message = result
+            self.statusBar.showMessage("Error generating context file.", 5000)
+            self._notify(QMessageBox.Icon.Critical, "Generation Failed",
+                         f"An error occurred:\n{error_message}")
+
+
+    # --- Settings Persistence ---
+
+    def _load_settings(self):
+        """Load saved settings on startup."""
+        # Load last output path. Accepted as-is — no stat at startup, which
+        # can block for seconds on cloud-sync or network drives. The path is
+        # validated when generation actually uses it: the processor creates
+        # the directory if needed and reports failures interactively.
+        # type=str makes QSettings do the conversion, so no None/isinstance
+        # branching is needed here
+        saved_path = self.settings.value(SETTINGS_OUTPUT_PATH, "", type=str)
+        if saved_path:
+            self.output_file_path = saved_path
+            self.output_path_display.setText(self.output_file_path)
+            self._last_saved_path = saved_path
+
+        # Load clipboard preference
+        copy_pref = self.settings.value(SETTINGS_COPY_CLIPBOARD, True, type=bool) # Default True
+        self.copy_clipboard_checkbox.setChecked(copy_pref)
+        self._last_saved_copy = copy_pref
+
+        # Initially disable generate button until a directory is loaded
+        self.generate_button.setEnabled(False)
+
+
+    @Slot()
+    def _schedule_settings_save(self, *_args):
+        """(Re)start the debounce timer; the actual write happens on settle."""
+        self._settings_timer.start()
+
+    @Slot()
+    def _flush_settings(self):
+        """Save current settings, writing only the keys that changed."""
+        if self.output_file_path and self.output_file_path != self._last_saved_path:
+            self.settings.setValue(SETTINGS_OUTPUT_PATH, self.output_file_path)
+            self._last_saved_path = self.output_file_path
+        copy_pref = self.copy_clipboard_checkbox.isChecked()
+        if copy_pref != self._last_saved_copy:
+            self.settings.setValue(SETTINGS_COPY_CLIPBOARD, copy_pref)
+            self._last_saved_copy = copy_pref
+        self.settings.sync()
+
+    def closeEvent(self, event):
+        """Save settings when closing the application."""
+        if self._generating:
+            # The worker QThread is parented to this window; letting the
+            # close proceed would destroy it mid-run, which Qt aborts on.
+            # Refuse the close until the generation finishes.
+            self.statusBar.showMessage(
+                "Generation in progress — please wait for it to finish before closing.", 3000)
+            event.ignore()
+            return
+        self._settings_timer.stop() # Pending debounce is superseded
+        self._flush_settings()
+        super().closeEvent(event)
\ No newline at end of file